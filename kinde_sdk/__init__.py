@@ -15,8 +15,6 @@ from kinde_sdk.auth.token_manager import TokenManager
 from kinde_sdk.auth.user_session import UserSession
 from kinde_sdk.auth import permissions, claims, portals, feature_flags
 from kinde_sdk.core.storage.storage_factory import StorageFactory
-from kinde_sdk.core.storage.redis_storage import RedisStorage
-from kinde_sdk.core.storage.redis_storage_factory import RedisStorageFactory, RedisFactory
 from kinde_sdk.core.framework.framework_factory import FrameworkFactory
 from kinde_sdk.core.framework.framework_interface import FrameworkInterface
 from kinde_sdk.core.framework.null_framework import NullFramework
@@ -39,3 +37,22 @@ __all__ = [
     "FrameworkInterface",
     "NullFramework",
 ]
+
+# Lazily resolved exports (PEP 562) so importing the package does not pull
+# in the redis client until a Redis-specific name is actually requested
+_LAZY_IMPORTS = {
+    "RedisStorage": ("kinde_sdk.core.storage.redis_storage", "RedisStorage"),
+    "RedisStorageFactory": ("kinde_sdk.core.storage.redis_storage_factory", "RedisStorageFactory"),
+    "RedisFactory": ("kinde_sdk.core.storage.redis_storage_factory", "RedisFactory"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
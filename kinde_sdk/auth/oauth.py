@@ -9,7 +9,6 @@ from urllib.parse import urlencode
 from .user_session import UserSession
 from kinde_sdk.core.storage.storage_manager import StorageManager
 import kinde_sdk.core.exceptions as core_exceptions
-from kinde_sdk.core.storage.redis_storage_factory import RedisStorageFactory
 from .config_loader import load_config
 from .enums import IssuerRouteTypes, PromptTypes
 from .login_options import LoginOptions
@@ -118,6 +117,16 @@ class OAuth:
                 except ImportError as e:
                     self._logger.error(f"Failed to import Flask framework: {e}")
                     raise
+
+            # Ensure Quart framework is registered (async-native fast path)
+            if self.framework == "quart":
+                try:
+                    # Import quart framework module to trigger registration
+                    import kinde_sdk.core.framework.quart
+                    self._logger.info("Quart framework module imported and registered")
+                except ImportError as e:
+                    self._logger.error(f"Failed to import Quart framework: {e}")
+                    raise
             
             # Create framework instance
             config = {"type": self.framework}
@@ -141,7 +150,10 @@ class OAuth:
         No framework dependencies required.
         """
         try:
-            # Use RedisStorage as primary storage via StorageFactory
+            # Use RedisStorage as primary storage via StorageFactory.
+            # Imported here so merely importing the SDK does not load redis
+            from kinde_sdk.core.storage.redis_storage_factory import RedisStorageFactory
+
             storage_config = self._config.get("storage", {"type": "redis", "options": {"redis_url": os.getenv("KINDE_REDIS_URL") or "redis://redis:6379/0"}})
             self._storage = RedisStorageFactory.create_storage(storage_config)
             
@@ -381,13 +393,13 @@ class OAuth:
         # Generate state if not provided
         state = login_options.get(LoginOptions.STATE, generate_random_string(32))
         search_params["state"] = state
-        self._session_manager.storage_manager.setItems("state", {"value": state})
-        
+        state_items = {"state": {"value": state}}
+
         # Generate nonce if not provided
         nonce = login_options.get(LoginOptions.NONCE, generate_random_string(16))
         search_params["nonce"] = nonce
-        self._session_manager.storage_manager.setItems("nonce", {"value": nonce})
-        
+        state_items["nonce"] = {"value": nonce}
+
         # Handle PKCE
         code_verifier = ""
         if login_options.get(LoginOptions.CODE_CHALLENGE):
@@ -397,7 +409,10 @@ class OAuth:
             pkce_data = await generate_pkce_pair(52)  # Use 52 chars to match JS implementation
             code_verifier = pkce_data["code_verifier"]
             search_params["code_challenge"] = pkce_data["code_challenge"]
-            self._session_manager.storage_manager.setItems("code_verifier", {"value": code_verifier})
+            state_items["code_verifier"] = {"value": code_verifier}
+
+        # Persist all short-lived auth artifacts in a single storage round-trip
+        await asyncio.to_thread(self._session_manager.storage_manager.set_many, state_items)
         
         # Set code challenge method
         code_challenge_method = login_options.get(LoginOptions.CODE_CHALLENGE_METHOD, "S256")
@@ -578,20 +593,20 @@ class OAuth:
 
         # Verify state if provided
         if state:
-            stored_state = self._session_manager.storage_manager.get("state")
+            stored_state = await asyncio.to_thread(self._session_manager.storage_manager.get, "state")
             self._logger.warning(f"stored_state: {stored_state}, state: {state}")
             if not stored_state or state != stored_state.get("value"):
                 self._logger.error(f"State mismatch: received {state}, stored {stored_state}")
                 raise core_exceptions.KindeLoginException("Invalid state parameter")
-        
+
         # Get code verifier for PKCE
         code_verifier = None
-        stored_code_verifier = self._session_manager.storage_manager.get("code_verifier")
+        stored_code_verifier = await asyncio.to_thread(self._session_manager.storage_manager.get, "code_verifier")
         if stored_code_verifier:
             code_verifier = stored_code_verifier.get("value")
-            
+
             # Clean up the used code verifier
-            self._session_manager.storage_manager.delete("code_verifier")
+            await asyncio.to_thread(self._session_manager.storage_manager.delete, "code_verifier")
         
         # Exchange code for tokens
         try:
@@ -625,10 +640,10 @@ class OAuth:
         
         # Clean up state
         if state:
-            self._session_manager.storage_manager.delete("state")
-        
+            await asyncio.to_thread(self._session_manager.storage_manager.delete, "state")
+
         # Clean up nonce
-        self._session_manager.storage_manager.delete("nonce")
+        await asyncio.to_thread(self._session_manager.storage_manager.delete, "nonce")
         
         return {
             "tokens": token_data,
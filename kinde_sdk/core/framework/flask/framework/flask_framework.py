@@ -5,11 +5,13 @@ from ..middleware.framework_middleware import FrameworkMiddleware
 import os
 import uuid
 import asyncio
+import base64
+import json
 import threading
 import logging
-import nest_asyncio
 import flask
 import time
+from urllib.parse import urlencode
 from flask import request
 if TYPE_CHECKING:
     from flask import Request
@@ -35,10 +37,26 @@ class FlaskFramework(FrameworkInterface):
         self._logger = logging.getLogger("kinde_sdk")
         self._logger.setLevel(logging.DEBUG)
         self._logger.propagate = True
-        # Enable nested event loops
-        nest_asyncio.apply()
+        # Run all OAuth coroutines on a single long-lived event loop so the
+        # HTTP client can reuse connections across requests instead of paying
+        # loop setup/teardown on every route hit.
+        self._bg_loop = asyncio.new_event_loop()
+        self._bg_thread = threading.Thread(
+            target=self._bg_loop.run_forever,
+            name="kinde-flask-event-loop",
+            daemon=True,
+        )
+        self._bg_thread.start()
+        # The redirect URI never changes at runtime, so resolve it (and the
+        # derived login route URL used by the reauth path) once up front.
+        self._redirect_uri = os.getenv("KINDE_REDIRECT_URI")
+        self._login_route_url = (
+            self._redirect_uri.replace("/callback", "") + "/login"
+            if self._redirect_uri
+            else None
+        )
+
 
-    
     def get_name(self) -> str:
         """
         Get the name of the framework.
@@ -75,10 +93,13 @@ class FlaskFramework(FrameworkInterface):
     def stop(self) -> None:
         """
         Stop the framework.
-        This method cleans up any Flask resources.
+        This method cleans up any Flask resources and shuts down the
+        background event loop.
         """
         if self._initialized:
             self._initialized = False
+        if self._bg_loop.is_running():
+            self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
     
     def get_app(self) -> Flask:
         """
@@ -92,24 +113,26 @@ class FlaskFramework(FrameworkInterface):
     def get_request(self) -> Optional['Request']:
         """
         Get the current request object.
-        
+        Flask's request proxy already resolves the active request in O(1),
+        so there is no need to go through FrameworkContext here.
+
         Returns:
             Optional[Request]: The current Flask request object, if available
         """
-        from kinde_sdk.core.framework.framework_context import FrameworkContext
-        return FrameworkContext.get_request()
-    
+        try:
+            return request._get_current_object()
+        except RuntimeError:
+            # No active request context
+            return None
+
     def get_user_id(self) -> Optional[str]:
         """
         Get the user ID from the current request.
-        
+
         Returns:
             Optional[str]: The user ID, or None if not available
         """
-        session_id = session.get('user_id')
-        if not session_id:
-            return None
-        return session_id
+        return session.get('user_id') or None
     
     def set_oauth(self, oauth) -> None:
         """
@@ -128,48 +151,11 @@ class FlaskFramework(FrameworkInterface):
     def _run_coroutine_sync(self, coroutine):
         """
         Run an async coroutine from a synchronous Flask route safely.
-        - Uses a fresh event loop by default to avoid closed/shared loop issues
-        - If a running loop exists (e.g., under ASGI), uses it directly
-        - Recovers gracefully if an 'Event loop is closed' RuntimeError occurs
+        The coroutine is submitted to the shared background event loop; the
+        Flask/WSGI worker thread never runs a loop of its own, so blocking on
+        the result here cannot deadlock.
         """
-        try:
-            try:
-                running_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                running_loop = None
-
-            if running_loop and running_loop.is_running():
-                # nest_asyncio.apply() is called in __init__, so re-entrancy is allowed
-                return running_loop.run_until_complete(coroutine)
-            else:
-                loop = asyncio.new_event_loop()
-                try:
-                    asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(coroutine)
-                finally:
-                    try:
-                        loop.run_until_complete(asyncio.sleep(0))
-                    except Exception:
-                        pass
-                    loop.close()
-                    try:
-                        asyncio.set_event_loop(None)
-                    except Exception:
-                        pass
-        except RuntimeError as e:
-            # Recover from closed loop scenarios
-            if 'event loop is closed' in str(e).lower():
-                loop = asyncio.new_event_loop()
-                try:
-                    asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(coroutine)
-                finally:
-                    loop.close()
-                    try:
-                        asyncio.set_event_loop(None)
-                    except Exception:
-                        pass
-            raise
+        return asyncio.run_coroutine_threadsafe(coroutine, self._bg_loop).result()
     
     def _register_kinde_routes(self) -> None:
         """
@@ -203,11 +189,7 @@ class FlaskFramework(FrameworkInterface):
             """Handle the OAuth callback from Kinde."""
             if not self._oauth:
                 return "OAuth not initialized", 500
-                
-            import base64
-            import json
-            from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
-            
+
             error = request.args.get('error')
             if error and error.lower() == 'login_link_expired':
                 reauth_state = request.args.get('reauth_state')
@@ -216,31 +198,9 @@ class FlaskFramework(FrameworkInterface):
                         decoded_auth_state = base64.b64decode(reauth_state).decode('utf-8')
                         reauth_dict = json.loads(decoded_auth_state)
 
-                        # Get the redirect URL from config
-                        redirect_url = os.getenv("KINDE_REDIRECT_URI")
-                        base_url = redirect_url.replace("/callback", "")
-
-                        # Build the login route URL
-                        login_route_url = f"{base_url}/login"
-
-                        # Parse and add parameters properly
-                        parsed = urlparse(login_route_url)
-                        query_dict = parse_qs(parsed.query)
-
-                        # Add reauth parameters
-                        for key, value in reauth_dict.items():
-                            query_dict[key] = [value]
-
-                        # Build final URL
-                        new_query = urlencode(query_dict, doseq=True)
-                        login_url = urlunparse((
-                            parsed.scheme,
-                            parsed.netloc,
-                            parsed.path,
-                            parsed.params,
-                            new_query,
-                            parsed.fragment
-                        ))
+                        # The precomputed login route URL has no query string,
+                        # so the reauth params can be appended directly.
+                        login_url = self._login_route_url + "?" + urlencode(reauth_dict)
 
                         return redirect(login_url)
                     except Exception as ex:
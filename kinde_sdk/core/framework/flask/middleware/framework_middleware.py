@@ -5,41 +5,61 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared kwargs for every queued cookie; built once instead of per set_cookie call
+_COOKIE_KW = {"httponly": True, "secure": True, "samesite": "Lax"}
+
+# Endpoints registered by FlaskFramework._register_kinde_routes. The middleware
+# is installed app-wide, so everything else (static files, application routes)
+# skips the context bookkeeping entirely.
+_KINDE_ENDPOINTS = frozenset({"login", "callback", "logout", "register", "user"})
+
 class FrameworkMiddleware:
     """
     Middleware for handling Flask-specific request/response processing.
     """
-    
+
     @staticmethod
     def before_request() -> None:
         """
         Process the request before it reaches the route handler.
-        Sets up the framework context with the current request.
+        Sets up the framework context with the current request for Kinde
+        routes; all other routes return immediately.
         """
+        if request.endpoint not in _KINDE_ENDPOINTS:
+            return
         FrameworkContext.set_request(request)
-        
+        # Falsy shared sentinel; cookie_set swaps in a dict on first write so
+        # the common zero-cookie case costs a single truthiness test later.
+        request._kinde_cookies_to_set = ()
+
     @staticmethod
     def after_request(response: Response) -> Response:
         """
         Process the response after it leaves the route handler.
-        
+
         Args:
             response (Response): The Flask response object.
-            
+
         Returns:
             Response: The processed response.
         """
+        if request.endpoint not in _KINDE_ENDPOINTS:
+            return response
         try:
             # If any cookies were queued on the request by storage, set them on the response
-            cookies_to_set = getattr(request, "_kinde_cookies_to_set", None)
-            if isinstance(cookies_to_set, dict):
+            try:
+                cookies_to_set = request._kinde_cookies_to_set
+            except AttributeError:
+                # before_request did not run for this request
+                cookies_to_set = None
+            if cookies_to_set:
                 for name, val in cookies_to_set.items():
                     try:
-                        response.set_cookie(name, val, httponly=True, secure=True, samesite="Lax")
+                        response.set_cookie(name, val, **_COOKIE_KW)
                     except Exception:
                         # Best-effort; continue setting other cookies
                         pass
         finally:
             # Clear the framework context regardless of cookie handling outcome
             FrameworkContext.clear_request()
-        return response
\ No newline at end of file
+        return response
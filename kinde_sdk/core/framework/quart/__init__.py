@@ -0,0 +1,7 @@
+from .framework.quart_framework import QuartFramework
+from kinde_sdk.core.framework.framework_factory import FrameworkFactory
+
+# Register the Quart framework
+FrameworkFactory.register_framework("quart", QuartFramework)
+
+__all__ = ['QuartFramework']
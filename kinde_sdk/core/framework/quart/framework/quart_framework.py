@@ -0,0 +1,258 @@
+from typing import Optional, Any, TYPE_CHECKING
+from quart import Quart, redirect, session, request
+from kinde_sdk.core.framework.framework_interface import FrameworkInterface
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+import asyncio
+import os
+import uuid
+import logging
+import time
+if TYPE_CHECKING:
+    from kinde_sdk.auth.oauth import OAuth
+
+class QuartFramework(FrameworkInterface):
+    """
+    Quart framework implementation.
+    Quart is async-native, so the Kinde routes await the OAuth coroutines
+    directly on the server's event loop - there is no sync/async bridge and
+    no per-request loop management as in the Flask implementation.
+    """
+
+    def __init__(self, app: Optional[Quart] = None):
+        """
+        Initialize the Quart framework.
+
+        Args:
+            app (Optional[Quart]): The Quart application instance.
+                If not provided, a new instance will be created.
+        """
+        self.app = app or Quart(__name__)
+        self._initialized = False
+        self._oauth = None
+        self._logger = logging.getLogger("kinde_sdk")
+        self._logger.setLevel(logging.DEBUG)
+        self._logger.propagate = True
+
+    def get_name(self) -> str:
+        """
+        Get the name of the framework.
+
+        Returns:
+            str: The name of the framework
+        """
+        return "quart"
+
+    def get_description(self) -> str:
+        """
+        Get a description of the framework.
+
+        Returns:
+            str: A description of the framework
+        """
+        return "Quart framework implementation for Kinde authentication"
+
+    def start(self) -> None:
+        """
+        Start the framework.
+        This method initializes any necessary Quart components and registers Kinde routes.
+        """
+        if not self._initialized:
+            # Set up the framework context around each request
+            self.app.before_request(self._before_request)
+            self.app.after_request(self._after_request)
+
+            # Register Kinde routes
+            self._register_kinde_routes()
+
+            self._initialized = True
+
+    def stop(self) -> None:
+        """
+        Stop the framework.
+        This method cleans up any Quart resources.
+        """
+        if self._initialized:
+            self._initialized = False
+
+    def get_app(self) -> Quart:
+        """
+        Get the Quart application instance.
+
+        Returns:
+            Quart: The Quart application instance
+        """
+        return self.app
+
+    def get_request(self) -> Optional[Any]:
+        """
+        Get the current request object.
+
+        Returns:
+            Optional[Any]: The current Quart request object, if available
+        """
+        return FrameworkContext.get_request()
+
+    def get_user_id(self) -> Optional[str]:
+        """
+        Get the user ID from the current request.
+
+        Returns:
+            Optional[str]: The user ID, or None if not available
+        """
+        return session.get('user_id') or None
+
+    def set_oauth(self, oauth) -> None:
+        """
+        Set the OAuth instance for this framework.
+
+        Args:
+            oauth (OAuth): The OAuth instance
+        """
+        self._oauth = oauth
+        # Expose on Quart app for compatibility with code expecting app.kinde_oauth
+        try:
+            setattr(self.app, 'kinde_oauth', oauth)
+        except Exception:
+            pass
+
+    @staticmethod
+    async def _before_request() -> None:
+        """Set up the framework context with the current request."""
+        FrameworkContext.set_request(request)
+
+    @staticmethod
+    async def _after_request(response):
+        """Propagate queued cookies and clear the framework context."""
+        try:
+            cookies_to_set = getattr(request, "_kinde_cookies_to_set", None)
+            if isinstance(cookies_to_set, dict):
+                for name, val in cookies_to_set.items():
+                    try:
+                        response.set_cookie(name, val, httponly=True, secure=True, samesite="Lax")
+                    except Exception:
+                        # Best-effort; continue setting other cookies
+                        pass
+        finally:
+            FrameworkContext.clear_request()
+        return response
+
+    def _set_device_id_cookie(self) -> None:
+        """Queue the device ID cookie if a storage manager is available."""
+        if hasattr(self._oauth, '_storage_manager') and self._oauth._storage_manager:
+            storage_manager = self._oauth._storage_manager
+            if hasattr(storage_manager, 'storage') and storage_manager.storage:
+                storage_manager.storage.cookie_set(
+                    "_device_id",
+                    {"value": storage_manager.get_device_id(), "timestamp": time.time()}
+                )
+
+    def _register_kinde_routes(self) -> None:
+        """
+        Register all Kinde-specific routes with the Quart application.
+        """
+        self._logger.info("Registering Kinde routes")
+
+        # Login route
+        async def login():
+            """Redirect to Kinde login page."""
+            if not self._oauth:
+                return "OAuth not initialized", 500
+
+            try:
+                self._set_device_id_cookie()
+                login_url = await self._oauth.login()
+                return redirect(login_url)
+            except Exception as e:
+                self._logger.error(f"Login error: {e}")
+                return f"Login failed: {str(e)}", 500
+
+        # Callback route
+        async def callback():
+            """Handle the OAuth callback from Kinde."""
+            if not self._oauth:
+                return "OAuth not initialized", 500
+
+            post_login_redirect = session.pop('post_login_redirect_url', None)
+            if post_login_redirect:
+                post_login_redirect = post_login_redirect.get('url', '/')
+            else:
+                post_login_redirect = '/'
+
+            code = request.args.get('code')
+            state = request.args.get('state')
+
+            # Validate required code parameter
+            if not code:
+                return "Authentication failed: Missing authorization code", 400
+
+            # Get or generate user_id
+            user_id = session.get('user_id', str(uuid.uuid4()))
+            session['user_id'] = user_id
+
+            try:
+                await self._oauth.handle_redirect(code, user_id, state)
+            except Exception as e:
+                return f"Authentication failed: {str(e)}", 400
+
+            if not post_login_redirect.startswith('http'):
+                post_login_redirect = str(request.url_root).rstrip('/') + post_login_redirect
+
+            # After successful authentication, simply redirect to the destination
+            return redirect(post_login_redirect)
+
+        # Logout route
+        async def logout():
+            """Logout the user and redirect to Kinde logout page."""
+            if not self._oauth:
+                return "OAuth not initialized", 500
+
+            try:
+                user_id = session.get('user_id')
+                session.clear()
+                logout_url = await self._oauth.logout(user_id)
+                return redirect(logout_url)
+            except Exception as e:
+                self._logger.error(f"Logout error: {e}")
+                return f"Logout failed: {str(e)}", 500
+
+        # Register route
+        async def register():
+            """Redirect to Kinde registration page."""
+            if not self._oauth:
+                return "OAuth not initialized", 500
+
+            try:
+                self._set_device_id_cookie()
+                register_url = await self._oauth.register()
+                return redirect(register_url)
+            except Exception as e:
+                self._logger.error(f"Register error: {e}")
+                return f"Registration failed: {str(e)}", 500
+
+        # User info route
+        async def get_user():
+            """Get the current user's information."""
+            if not self._oauth:
+                return "OAuth not initialized", 500
+
+            try:
+                self._set_device_id_cookie()
+
+                # is_authenticated/get_user_info are synchronous and do
+                # blocking storage and token-refresh I/O; run them in a
+                # worker thread so they cannot stall the event loop
+                if not await asyncio.to_thread(self._oauth.is_authenticated):
+                    login_url = await self._oauth.login()
+                    return redirect(login_url)
+
+                return await asyncio.to_thread(self._oauth.get_user_info)
+            except Exception as e:
+                self._logger.error(f"Get user error: {e}")
+                return f"Failed to get user info: {str(e)}", 400
+
+        # Register routes using add_url_rule to avoid decorator edge cases
+        self.app.add_url_rule('/login', 'login', login)
+        self.app.add_url_rule('/callback', 'callback', callback)
+        self.app.add_url_rule('/logout', 'logout', logout)
+        self.app.add_url_rule('/register', 'register', register)
+        self.app.add_url_rule('/user', 'user', get_user)
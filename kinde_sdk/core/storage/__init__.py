@@ -2,14 +2,33 @@
 from .storage_interface import StorageInterface
 from .storage_factory import StorageFactory
 from .storage_manager import StorageManager
-from .redis_storage import RedisStorage
-from .redis_storage_factory import RedisStorageFactory, RedisFactory
+from .memory_storage import MemoryStorage
+
+# Redis-backed exports resolve lazily (PEP 562) so importing the storage
+# package does not load the redis client until one of them is requested
+_LAZY_IMPORTS = {
+    "RedisStorage": (".redis_storage", "RedisStorage"),
+    "RedisStorageFactory": (".redis_storage_factory", "RedisStorageFactory"),
+    "RedisFactory": (".redis_storage_factory", "RedisFactory"),
+}
 
 __all__ = [
     'StorageInterface',
     'StorageFactory',
     'StorageManager',
+    'MemoryStorage',
     'RedisStorage',
     'RedisStorageFactory',
     'RedisFactory',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
@@ -0,0 +1,39 @@
+from typing import Dict, Optional
+from .storage_interface import StorageInterface
+
+
+class MemoryStorage(StorageInterface):
+    """
+    In-memory storage implementation.
+
+    Holds all data in process-local dicts. Used as the non-Redis fallback
+    for tests and development; data does not survive process restarts and
+    is not shared between workers.
+    """
+
+    def __init__(self):
+        self._storage: Dict[str, Dict] = {}
+        self._cookies: Dict[str, Dict] = {}
+        self._flat_data: Optional[str] = None
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._storage.get(key)
+
+    def set(self, key: str, value: Dict) -> None:
+        self._storage[key] = value
+
+    def cookie_set(self, key: str, value: Dict) -> None:
+        self._cookies[key] = value
+
+    def cookie_get(self, key: str) -> Dict:
+        return self._cookies.get(key, {})
+
+    def delete(self, key: str) -> None:
+        self._storage.pop(key, None)
+
+    def clear_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._storage if k.startswith(prefix)]:
+            del self._storage[key]
+
+    def set_flat(self, value: str) -> None:
+        self._flat_data = value
@@ -1,8 +1,12 @@
 from typing import Dict, Optional
 from .storage_interface import StorageInterface
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+import functools
 import logging
 import os
-import json
+import orjson
+import socket
+import threading
 from urllib.parse import urlparse
 import base64
 
@@ -12,6 +16,77 @@ try:  # pragma: no cover - exercised in runtime environments with redis installe
 except Exception:  # pragma: no cover
     redis = None  # type: ignore
 
+# Suffixes that mark short-lived OAuth artifacts. Keys produced by the SDK
+# are lowercase, so the raw endswith check hits first and the .lower()
+# allocation only happens for unusual caller-supplied keys.
+_STATE_SUFFIXES = (":state", ":nonce", ":code_verifier", "state")
+_STATE_POP_SUFFIXES = (":state", "state")
+
+# Probe idle sockets so dead connections are detected before a burst of OAuth
+# traffic pays a reconnect handshake. The TCP_KEEP* constants are platform
+# dependent, so only the ones this platform exposes are passed through.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Shared clients keyed by (host, port, db) so repeated storage construction
+# reuses warm TCP connections instead of allocating a new pool per instance.
+_CLIENT_CACHE: Dict[tuple, "redis.StrictRedis"] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_redis_url(url: str) -> tuple:
+    """
+    Parse a Redis URL into (host, port, db), memoized per URL.
+    The common redis://host:port/db form is handled with cheap string
+    splits; anything more exotic (auth, IPv6) falls back to urlparse.
+    """
+    scheme, sep, rest = url.partition("://")
+    if sep and "@" not in rest and rest.count(":") <= 1:
+        hostport, _, db_part = rest.partition("/")
+        host, _, port = hostport.partition(":")
+        # Only take the shortcut when port and db are plain digits; query
+        # strings and other decorations go through urlparse, which knows
+        # how to separate them from the path
+        if (not port or port.isdigit()) and (not db_part or db_part.isdigit()):
+            return (host or "redis", int(port or 6379), int(db_part) if db_part else 2)
+
+    parsed_url = urlparse(url)
+    host = parsed_url.hostname or "redis"
+    port = int(parsed_url.port or 6379)
+    db_path = (parsed_url.path or "/2").lstrip("/")
+    return (host, port, int(db_path) if db_path else 2)
+
+
+def _get_client(host: str, port: int, db: int) -> "redis.StrictRedis":
+    """Get or create a cached Redis client for the given connection tuple."""
+    key = (host, port, db)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                # A blocking pool makes exhaustion under concurrent Flask
+                # workers wait for a free socket instead of raising
+                # "too many connections"
+                pool = redis.BlockingConnectionPool(
+                    host=host,
+                    port=port,
+                    db=db,
+                    max_connections=50,
+                    timeout=20,
+                    socket_keepalive=True,
+                    socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                    health_check_interval=30,
+                    retry_on_timeout=True,
+                )
+                client = redis.StrictRedis(connection_pool=pool)
+                _CLIENT_CACHE[key] = client
+    return client
+
 
 class RedisStorage(StorageInterface):
     """
@@ -24,8 +99,6 @@ class RedisStorage(StorageInterface):
 
     def __init__(self, redis_url: Optional[str] = None, state_ttl_seconds: Optional[int] = None):
         self._logger = logging.getLogger("redis")
-        logging.basicConfig(level=logging.DEBUG)
-        logging.getLogger("redis").setLevel(logging.DEBUG)
 
         if redis is None:
             raise RuntimeError("redis package is required for RedisStorage")
@@ -37,88 +110,129 @@ class RedisStorage(StorageInterface):
         )
         self._state_ttl = state_ttl_seconds or int(os.getenv("KINDE_STATE_TTL", "600"))
 
-        parsed_url = urlparse(self._redis_url)
-        host = parsed_url.hostname or "redis"
-        port = int(parsed_url.port or 6379)
-        db_path = (parsed_url.path or "/2").lstrip("/")
-        db = int(db_path) if db_path else 2
+        host, port, db = _parse_redis_url(self._redis_url)
 
-        self._client = redis.StrictRedis(host=host, port=port, db=db)
-        self._logger.info(f"Redis client initialized for host '{host}', port '{port}', db '{db}'")
+        self._client = _get_client(host, port, db)
+        # Lua fallback for the atomic state pop on Redis servers older than
+        # 6.2 (no GETDEL). Registered once; loaded server-side on first use.
+        self._pop_script = self._client.register_script(
+            "local v=redis.call('GET',KEYS[1]); redis.call('DEL',KEYS[1]); return v"
+        )
+        self._logger.info("Redis client initialized for host '%s', port '%s', db '%s'", host, port, db)
+
+    def _pop_state(self, key: str):
+        """
+        Atomically read and delete a state-like key in one round-trip.
+        Uses GETDEL (Redis 6.2+) and falls back to the cached Lua script
+        on older servers.
+        """
+        try:
+            return self._client.getdel(key)
+        except redis.exceptions.ResponseError:
+            return self._pop_script(keys=[key])
 
     def _is_state_like(self, key: str) -> bool:
-        lowered = key.lower()
-        return (
-            lowered.endswith(":state")
-            or lowered.endswith(":nonce")
-            or lowered.endswith(":code_verifier")
-            or lowered.endswith("state")
-        )
+        return key.endswith(_STATE_SUFFIXES) or key.lower().endswith(_STATE_SUFFIXES)
 
     def get(self, key: str) -> Optional[Dict]:
         try:
             # Atomic pop for state to prevent replay
-            if key.lower().endswith(":state") or key.lower().endswith("state"):
-                pipe = self._client.pipeline()
-                pipe.get(key)
-                pipe.delete(key)
-                value, _ = pipe.execute()
+            if key.endswith(_STATE_POP_SUFFIXES) or key.lower().endswith(_STATE_POP_SUFFIXES):
+                value = self._pop_state(key)
                 if not value:
                     return None
-                if isinstance(value, bytes):
-                    value = value.decode("utf-8")
-                return json.loads(value)
+                return orjson.loads(value)
 
             raw = self._client.get(key)
             if not raw:
                 return None
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
-            self._logger.info(f"Redis get successful for key '{key}' value '{raw}'")
-            return json.loads(raw)
+            return orjson.loads(raw)
         except Exception as ex:
-            self._logger.warning(f"Redis get failed for key '{key}': {ex}")
+            self._logger.warning("Redis get failed for key '%s': %s", key, ex)
             return None
 
     def set(self, key: str, value: Dict) -> None:
         try:
-            data = json.dumps(value)
+            data = orjson.dumps(value)
             if self._is_state_like(key) and self._state_ttl > 0:
                 self._client.setex(key, self._state_ttl, data)
             else:
                 self._client.set(key, data)
-            self._logger.info(f"Redis set successful for key '{key}'")
         except Exception as ex:
-            self._logger.warning(f"Redis set failed for key '{key}': {ex}")
+            self._logger.warning("Redis set failed for key '%s': %s", key, ex)
 
-    def cookie_set(self, key: str, value: Dict) -> None:
+    def set_many(self, items: Dict[str, Dict]) -> None:
         try:
-            # Encode dict as JSON then base64 for cookie-safe value
-            json_str = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
-            encoded = base64.b64encode(json_str.encode("utf-8")).decode("ascii")
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in items.items():
+                data = orjson.dumps(value)
+                if self._is_state_like(key) and self._state_ttl > 0:
+                    pipe.setex(key, self._state_ttl, data)
+                else:
+                    pipe.set(key, data)
+            pipe.execute()
+        except Exception as ex:
+            self._logger.warning("Redis set_many failed for keys %s: %s", list(items), ex)
 
+    def get_many(self, keys) -> Dict[str, Optional[Dict]]:
+        try:
+            # Plain reads only - the atomic state pop stays in get() so
+            # batched reads cannot weaken replay protection
+            raw_values = self._client.mget(keys)
+            return {
+                key: orjson.loads(raw) if raw else None
+                for key, raw in zip(keys, raw_values)
+            }
+        except Exception as ex:
+            self._logger.warning("Redis get_many failed for keys %s: %s", list(keys), ex)
+            return {key: None for key in keys}
+
+    def cookie_set(self, key: str, value: Dict) -> None:
+        try:
             # Attach to current framework request for middleware to set on response
             try:
-                from kinde_sdk.core.framework.framework_context import FrameworkContext
                 request = FrameworkContext.get_request()
                 if request is not None:
-                    if not hasattr(request, "_kinde_cookies_to_set") or getattr(request, "_kinde_cookies_to_set") is None:
-                        setattr(request, "_kinde_cookies_to_set", {})
-                    request._kinde_cookies_to_set[key] = encoded
+                    plain = getattr(request, "_kinde_cookie_plain", None)
+                    if plain is None:
+                        request._kinde_cookie_plain = plain = {}
+                    elif plain.get(key) == value:
+                        # Same value already queued during this request; skip
+                        # the redundant serialize + base64 round-trip
+                        return
+
+                    # Encode dict as JSON then base64 for cookie-safe value
+                    # (orjson output is already compact UTF-8 bytes). The
+                    # URL-safe alphabet with padding stripped keeps Set-Cookie
+                    # headers free of characters that would need escaping.
+                    encoded = base64.urlsafe_b64encode(orjson.dumps(value)).rstrip(b"=").decode("ascii")
+
+                    plain[key] = value
+                    cookies = getattr(request, "_kinde_cookies_to_set", None)
+                    if not isinstance(cookies, dict):
+                        # Replace the middleware's empty-tuple sentinel (or a
+                        # missing attribute) with a real dict on first write
+                        request._kinde_cookies_to_set = cookies = {}
+                    cookies[key] = encoded
                 else:
                     self._logger.debug("cookie_set called with no active request context; skipping attach to response")
             except Exception as inner_ex:
-                self._logger.warning(f"cookie_set could not attach cookie to request: {inner_ex}")
+                self._logger.warning("cookie_set could not attach cookie to request: %s", inner_ex)
         except Exception as ex:
-            self._logger.warning(f"cookie_set failed for key '{key}': {ex}")
+            self._logger.warning("cookie_set failed for key '%s': %s", key, ex)
     
     def cookie_get(self, key: str) -> Dict:
         try:
-            from kinde_sdk.core.framework.framework_context import FrameworkContext
             request = FrameworkContext.get_request()
             if request is None:
                 return {}
 
+            # A value written earlier in this request is still in plain form;
+            # return it without a base64 decode
+            plain = getattr(request, "_kinde_cookie_plain", None)
+            if plain is not None and key in plain:
+                return plain[key]
+
             raw_val = None
             try:
                 # Flask request has .cookies mapping
@@ -129,24 +243,46 @@ class RedisStorage(StorageInterface):
             if not raw_val:
                 return {}
 
-            # Decode base64 -> JSON -> dict
-            # Add padding if stripped
-            padding = "=" * (-len(raw_val) % 4)
-            decoded_bytes = base64.b64decode(raw_val + padding)
-            return json.loads(decoded_bytes.decode("utf-8"))
+            # Decode base64 -> JSON -> dict. A fixed "===" suffix covers any
+            # stripped padding without computing it per value; excess "=" is
+            # legal input to the decoder.
+            decoded_bytes = base64.urlsafe_b64decode(raw_val + "===")
+            return orjson.loads(decoded_bytes)
         except Exception as ex:
-            self._logger.warning(f"cookie_get failed for key '{key}': {ex}")
+            self._logger.warning("cookie_get failed for key '%s': %s", key, ex)
             return {}
 
     def delete(self, key: str) -> None:
         try:
             self._client.delete(key)
         except Exception as ex:
-            self._logger.warning(f"Redis delete failed for key '{key}': {ex}")
+            self._logger.warning("Redis delete failed for key '%s': %s", key, ex)
+
+    def clear_prefix(self, prefix: str) -> None:
+        """
+        Delete every key under a prefix in batched pipelines.
+
+        SCAN walks the keyspace incrementally and UNLINK frees memory
+        asynchronously on the server, so large device namespaces clear
+        without blocking Redis or paying one round-trip per key.
+        """
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pending = 0
+            for k in self._client.scan_iter(match=prefix + "*", count=1000):
+                pipe.unlink(k)
+                pending += 1
+                if pending >= 500:
+                    pipe.execute()
+                    pending = 0
+            if pending:
+                pipe.execute()
+        except Exception as ex:
+            self._logger.warning("Redis clear_prefix failed for prefix '%s': %s", prefix, ex)
 
     def set_flat(self, value: str) -> None:
         try:
             # Flat channel for opaque values if needed by callers
             self._client.set("kinde:core:flat_data", value)
         except Exception as ex:
-            self._logger.warning(f"Redis set_flat failed: {ex}")
\ No newline at end of file
+            self._logger.warning("Redis set_flat failed: %s", ex)
\ No newline at end of file
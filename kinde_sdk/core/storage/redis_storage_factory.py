@@ -39,7 +39,7 @@ class RedisStorageFactory:
             redis_url = None
             state_ttl_seconds = None
             
-        logger.info(f"Creating RedisStorage with redis_url={redis_url}, state_ttl_seconds={state_ttl_seconds}")
+        logger.info("Creating RedisStorage with redis_url=%s, state_ttl_seconds=%s", redis_url, state_ttl_seconds)
         return RedisStorage(redis_url=redis_url, state_ttl_seconds=state_ttl_seconds)
 
 
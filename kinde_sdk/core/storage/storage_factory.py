@@ -1,30 +1,54 @@
+from types import MappingProxyType
 from typing import Dict, Any, Type, Optional
 from .storage_interface import StorageInterface
-from .redis_storage_factory import RedisStorageFactory
+from .memory_storage import MemoryStorage
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _create_redis_storage(config: Optional[Dict[str, Any]]) -> StorageInterface:
+    # Imported on first use so that selecting the memory backend (or merely
+    # importing the factory) never loads the redis client
+    from .redis_storage_factory import RedisStorageFactory
+    return RedisStorageFactory.create_storage(config)
+
+
 class StorageFactory:
-    _framework_factories = {}
-    
+    # Read on every create_storage call but written only during SDK init.
+    # Published as a read-only proxy over a copy-on-write backing dict, so
+    # the lookup path needs no lock and registration can never mutate a
+    # mapping another thread is reading
+    _ff_backing: Dict[str, Type] = {}
+    _framework_factories = MappingProxyType(_ff_backing)
+
+    # Built-in backends dispatched by type in O(1) instead of an if/elif chain
+    _builtin = {
+        "redis": _create_redis_storage,
+        "memory": lambda config: MemoryStorage(),
+    }
+
     @classmethod
     def register_framework_factory(cls, framework: str, factory_class: Type) -> None:
         """
         Register a framework-specific storage factory.
-        
+
         Args:
             framework (str): The framework name (e.g., 'flask')
             factory_class (Type): The storage factory class for the framework
         """
-        logger.info(f"Registering storage factory: {framework}")
-        cls._framework_factories[framework] = factory_class
-    
+        logger.info("Registering storage factory: %s", framework)
+        backing = dict(cls._ff_backing)
+        backing[framework] = factory_class
+        cls._ff_backing = backing
+        cls._framework_factories = MappingProxyType(backing)
+
     @classmethod
     def create_storage(cls, config: Optional[Dict[str, Any]] = None) -> StorageInterface:
         """
         Create a storage backend based on the provided configuration.
-        RedisStorage is now the primary backend, with fallbacks to memory/local storage.
+        RedisStorage is the primary backend; the built-in memory backend and
+        legacy framework factories are available by type.
 
         Args:
             config (Optional[Dict[str, Any]]): Configuration dictionary containing storage settings.
@@ -34,29 +58,25 @@ class StorageFactory:
         """
         config = config or {}
         storage_type = config.get("type")
-        
-        # If a specific storage type is requested, use that
+
         if storage_type:
-            logger.info(f"Storage type requested: {storage_type}")
-            
-            # Primary: RedisStorage (framework-agnostic)
-            if storage_type == "redis":
-                return RedisStorageFactory.create_storage(config)
-                
-            
-            # Legacy framework-specific types (check first for backward compatibility)
-            elif storage_type in cls._framework_factories:
+            factory = cls._builtin.get(storage_type)
+            if factory is not None:
+                return factory(config)
+
+            # Legacy framework-specific types (kept for backward compatibility)
+            factory_class = cls._framework_factories.get(storage_type)
+            if factory_class is not None:
                 try:
-                    factory_class = cls._framework_factories[storage_type]
-                    logger.info(f"Using legacy framework factory for {storage_type}")
+                    logger.info("Using legacy framework factory for %s", storage_type)
                     return factory_class.create_storage(config)
                 except Exception as e:
-                    logger.warning(f"Failed to create {storage_type} storage, falling back to Redis: {str(e)}")
-                    return RedisStorageFactory.create_storage(config)
-            else:
-                logger.warning(f"Unsupported storage type: {storage_type}, trying Redis as fallback")
-                return RedisStorageFactory.create_storage(config)
-        
-        # Default: Try RedisStorage first, fallback to memory
-        logger.info("No storage type specified; trying Redis as primary, fallback to redis one more time")
-        return RedisStorageFactory.create_storage(config)
\ No newline at end of file
+                    logger.warning("Failed to create %s storage, falling back to Redis: %s", storage_type, e)
+                    return _create_redis_storage(config)
+
+            logger.warning("Unsupported storage type: %s, trying Redis as fallback", storage_type)
+            return _create_redis_storage(config)
+
+        # Default: Redis as primary
+        logger.info("No storage type specified; trying Redis as primary")
+        return _create_redis_storage(config)
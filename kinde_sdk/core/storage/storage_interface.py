@@ -1,6 +1,9 @@
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class StorageInterface(ABC):
@@ -50,6 +53,47 @@ class StorageInterface(ABC):
         """
         pass
 
+    def set_many(self, items: Dict[str, Dict]) -> None:
+        """
+        Store several key/value pairs in one call.
+        Backends that support batching override this to issue a single
+        round-trip; the default falls back to one set per item.
+
+        Args:
+            items (Dict[str, Dict]): Mapping of keys to the data to store.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several keys in one call.
+        Backends that support batching override this to issue a single
+        round-trip; the default falls back to one get per key.
+
+        Args:
+            keys (List[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Optional[Dict]]: Mapping of each key to its stored data or None.
+        """
+        return {key: self.get(key) for key in keys}
+
+    def clear_prefix(self, prefix: str) -> None:
+        """
+        Delete every key that starts with the given prefix.
+        Backends override this with an implementation suited to their
+        keyspace; the default logs and does nothing so best-effort
+        cleanup paths (like logout) degrade gracefully.
+
+        Args:
+            prefix (str): The key prefix to clear.
+        """
+        logger.warning(
+            "%s does not implement clear_prefix; skipping clear of '%s*'",
+            type(self).__name__, prefix,
+        )
+
     @abstractmethod
     def set_flat(self, value: str) -> None:
         """
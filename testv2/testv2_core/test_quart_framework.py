@@ -0,0 +1,130 @@
+import unittest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+# Quart is an optional dependency; skip the module cleanly when absent
+pytest.importorskip("quart")
+from quart import Quart
+
+from kinde_sdk.core.framework.quart import QuartFramework
+
+
+def run_async(coro):
+    """Helper function to run async tests"""
+    return asyncio.run(coro)
+
+
+class TestQuartFramework(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = Quart(__name__)
+        self.app.secret_key = "test_secret"
+        self.framework = QuartFramework(self.app)
+
+        # Mock OAuth with async entry points
+        self.mock_oauth = MagicMock()
+        self.mock_oauth.login = AsyncMock(return_value="https://example.com/login")
+        self.mock_oauth.register = AsyncMock(return_value="https://example.com/register")
+        self.mock_oauth.logout = AsyncMock(return_value="https://example.com/logout")
+        self.mock_oauth.handle_redirect = AsyncMock(return_value=None)
+        self.framework.set_oauth(self.mock_oauth)
+
+        self.framework.start()
+
+    def test_framework_metadata(self):
+        """Test framework name and description."""
+        self.assertEqual(self.framework.get_name(), "quart")
+        self.assertIn("Quart", self.framework.get_description())
+        self.assertIs(self.framework.get_app(), self.app)
+
+    def test_route_registration(self):
+        """Test that all Kinde routes are registered on start()."""
+        endpoints = {rule.endpoint for rule in self.app.url_map.iter_rules()}
+        for endpoint in ("login", "callback", "logout", "register", "user"):
+            self.assertIn(endpoint, endpoints)
+
+    def test_login_route_redirects(self):
+        """Test that the login route redirects to the auth URL."""
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/login")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "https://example.com/login")
+        self.mock_oauth.login.assert_awaited_once()
+
+    def test_callback_flow(self):
+        """Test the OAuth callback invokes handle_redirect and redirects."""
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/callback?code=test_code&state=test_state")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 302)
+        args, _ = self.mock_oauth.handle_redirect.await_args
+        self.assertEqual(args[0], "test_code")
+        self.assertEqual(args[2], "test_state")
+
+    def test_callback_missing_code(self):
+        """Test that the callback rejects requests without a code."""
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/callback?state=test_state")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 400)
+        self.mock_oauth.handle_redirect.assert_not_awaited()
+
+    def test_callback_handles_redirect_failure(self):
+        """Test that a failing handle_redirect yields a 400 response."""
+        self.mock_oauth.handle_redirect = AsyncMock(side_effect=Exception("bad code"))
+
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/callback?code=test_code&state=test_state")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 400)
+
+    def test_logout_route_redirects(self):
+        """Test that the logout route clears the session and redirects."""
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/logout")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "https://example.com/logout")
+        self.mock_oauth.logout.assert_awaited_once()
+
+    def test_user_route_redirects_when_unauthenticated(self):
+        """Test that /user sends unauthenticated users to login."""
+        self.mock_oauth.is_authenticated = MagicMock(return_value=False)
+
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/user")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "https://example.com/login")
+
+    def test_user_route_returns_user_info(self):
+        """Test that /user returns user info for authenticated users."""
+        self.mock_oauth.is_authenticated = MagicMock(return_value=True)
+        self.mock_oauth.get_user_info = MagicMock(return_value={"id": "test_user"})
+
+        async def run():
+            client = self.app.test_client()
+            return await client.get("/user")
+
+        response = run_async(run())
+        self.assertEqual(response.status_code, 200)
+        self.mock_oauth.get_user_info.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
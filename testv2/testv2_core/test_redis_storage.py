@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from kinde_sdk.core.storage.redis_storage import RedisStorage
+
+
+class TestRedisStorageBatching(unittest.TestCase):
+    def setUp(self):
+        """Set up a RedisStorage backed by a mocked client."""
+        self.mock_client = MagicMock()
+        self.mock_pipe = MagicMock()
+        self.mock_client.pipeline.return_value = self.mock_pipe
+
+        patcher = patch(
+            "kinde_sdk.core.storage.redis_storage._get_client",
+            return_value=self.mock_client,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.storage = RedisStorage(
+            redis_url="redis://localhost:6379/0",
+            state_ttl_seconds=600,
+        )
+
+    def test_set_many_batches_through_pipeline(self):
+        """Test set_many issues one non-transactional pipeline."""
+        items = {
+            "device:abc:access_token": {"value": "token"},
+            "device:abc:profile": {"name": "test"},
+        }
+
+        self.storage.set_many(items)
+
+        self.mock_client.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(self.mock_pipe.set.call_count, 2)
+        self.mock_pipe.setex.assert_not_called()
+        self.mock_pipe.execute.assert_called_once()
+
+    def test_set_many_applies_ttl_to_state_keys(self):
+        """Test set_many uses SETEX for state-like keys."""
+        items = {
+            "user:123:state": {"value": "abc"},
+            "user:123:nonce": {"value": "def"},
+            "user:123:code_verifier": {"value": "ghi"},
+            "device:abc:access_token": {"value": "token"},
+        }
+
+        self.storage.set_many(items)
+
+        self.assertEqual(self.mock_pipe.setex.call_count, 3)
+        for call in self.mock_pipe.setex.call_args_list:
+            key, ttl, data = call.args
+            self.assertEqual(ttl, 600)
+            self.assertEqual(data, orjson.dumps(items[key]))
+        self.mock_pipe.set.assert_called_once_with(
+            "device:abc:access_token", orjson.dumps({"value": "token"})
+        )
+        self.mock_pipe.execute.assert_called_once()
+
+    def test_get_many_uses_mget(self):
+        """Test get_many fetches all keys in one MGET round-trip."""
+        keys = ["device:abc:access_token", "device:abc:missing"]
+        self.mock_client.mget.return_value = [
+            orjson.dumps({"value": "token"}),
+            None,
+        ]
+
+        result = self.storage.get_many(keys)
+
+        self.mock_client.mget.assert_called_once_with(keys)
+        self.assertEqual(
+            result,
+            {"device:abc:access_token": {"value": "token"}, "device:abc:missing": None},
+        )
+
+    def test_get_many_returns_nones_on_failure(self):
+        """Test get_many degrades to all-None when the client errors."""
+        keys = ["device:abc:access_token"]
+        self.mock_client.mget.side_effect = Exception("connection lost")
+
+        result = self.storage.get_many(keys)
+        self.assertEqual(result, {"device:abc:access_token": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,7 +62,7 @@ class TestStorageManager(unittest.TestCase):
         """Test key namespacing functionality."""
         # Test device-specific key
         key = "test_key"
-        expected = f"device:{self.test_device_id}:{key}"
+        expected = f"{{device:{self.test_device_id}}}:{key}"
         self.assertEqual(self.storage_manager._get_namespaced_key(key), expected)
         
         # Test global key
@@ -81,7 +81,7 @@ class TestStorageManager(unittest.TestCase):
         
         result = self.storage_manager.get(test_key)
         self.assertEqual(result, test_value)
-        self.mock_storage.get.assert_called_once_with(f"device:{self.test_device_id}:{test_key}")
+        self.mock_storage.get.assert_called_once_with(f"{{device:{self.test_device_id}}}:{test_key}")
 
     def test_setItems(self):
         """Test setItems method."""
@@ -90,7 +90,7 @@ class TestStorageManager(unittest.TestCase):
         
         self.storage_manager.setItems(test_key, test_value)
         self.mock_storage.set.assert_called_once_with(
-            f"device:{self.test_device_id}:{test_key}",
+            f"{{device:{self.test_device_id}}}:{test_key}",
             test_value
         )
 
@@ -105,7 +105,32 @@ class TestStorageManager(unittest.TestCase):
         test_key = "test_key"
         self.storage_manager.delete(test_key)
         self.mock_storage.delete.assert_called_once_with(
-            f"device:{self.test_device_id}:{test_key}"
+            f"{{device:{self.test_device_id}}}:{test_key}"
+        )
+
+    def test_set_many(self):
+        """Test set_many namespaces every key in the batch."""
+        items = {"key1": {"value": "one"}, "key2": {"value": "two"}}
+
+        self.storage_manager.set_many(items)
+        self.mock_storage.set_many.assert_called_once_with({
+            f"{{device:{self.test_device_id}}}:key1": {"value": "one"},
+            f"{{device:{self.test_device_id}}}:key2": {"value": "two"},
+        })
+
+    def test_get_many(self):
+        """Test get_many maps results back to the original keys."""
+        namespaced_key1 = f"{{device:{self.test_device_id}}}:key1"
+        namespaced_key2 = f"{{device:{self.test_device_id}}}:key2"
+        self.mock_storage.get_many.return_value = {
+            namespaced_key1: {"value": "one"},
+            namespaced_key2: None,
+        }
+
+        result = self.storage_manager.get_many(["key1", "key2"])
+        self.assertEqual(result, {"key1": {"value": "one"}, "key2": None})
+        self.mock_storage.get_many.assert_called_once_with(
+            [namespaced_key1, namespaced_key2]
         )
 
     def test_clear_device_data(self):
@@ -113,7 +138,7 @@ class TestStorageManager(unittest.TestCase):
         # Test with storage that supports clear_prefix
         #self.mock_storage.clear_prefix = MagicMock()
         #self.storage_manager.clear_device_data()
-        #self.mock_storage.clear_prefix.assert_called_once_with(f"device:{self.test_device_id}:")
+        #self.mock_storage.clear_prefix.assert_called_once_with(f"{{device:{self.test_device_id}}}:")
 
         # Test with storage that doesn't support clear_prefix
         #self.mock_storage.clear_prefix = None